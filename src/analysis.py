@@ -3,17 +3,93 @@ import numpy as np
 from datetime import datetime, timedelta
 
 
+def _growth_kernel(confirmed, deaths, window=7):
+    """Daily change, growth rate and moving average for both series at once"""
+    totals = np.vstack([confirmed, deaths]).astype(np.float64)
+
+    daily = np.full_like(totals, np.nan)
+    daily[:, 1:] = totals[:, 1:] - totals[:, :-1]
+
+    # Growth rate is NaN where the previous day's total was zero
+    growth = np.full_like(totals, np.nan)
+    np.divide(
+        daily[:, 1:], totals[:, :-1], out=growth[:, 1:], where=totals[:, :-1] != 0
+    )
+    growth *= 100
+    np.round(growth, 2, out=growth)
+
+    # Moving average from running sums; a window is NaN only if it contains
+    # a NaN (such as the first day, which has no daily change)
+    missing = np.isnan(daily)
+    average = np.full_like(totals, np.nan)
+    if totals.shape[1] >= window:
+        running = np.zeros((2, totals.shape[1] + 1))
+        np.cumsum(np.where(missing, 0, daily), axis=1, out=running[:, 1:])
+        gaps = np.zeros((2, totals.shape[1] + 1), dtype=np.int64)
+        np.cumsum(missing, axis=1, out=gaps[:, 1:])
+
+        window_sum = running[:, window:] - running[:, :-window]
+        has_gap = (gaps[:, window:] - gaps[:, :-window]) > 0
+        average[:, window - 1 :] = np.where(has_gap, np.nan, window_sum / window)
+
+    return daily, growth, average
+
+
+def _top_n(df, column, n):
+    """Rows holding the n largest values of column, like nlargest(keep="first")"""
+    values = df[column].to_numpy(dtype=np.float64)
+    positions = np.flatnonzero(~np.isnan(values))
+    values = values[positions]
+    n = min(n, len(values))
+    if n <= 0:
+        return df.iloc[:0]
+
+    # Everything tied with the n-th largest value is a candidate; ties are
+    # then broken by original row order
+    kth = np.partition(values, -n)[-n]
+    candidates = np.flatnonzero(values >= kth)
+    order = np.lexsort((candidates, -values[candidates]))[:n]
+    return df.iloc[positions[candidates[order]]]
+
+
 class CovidAnalysis:
     def __init__(self, data):
         self.data = data
 
+        # Date-sorted view so per-date lookups are a binary search, not a scan
+        self._by_date = (
+            data.set_index("Date", drop=False)
+            .rename_axis(None)
+            .sort_index(kind="stable")
+        )
+        self._latest_date = data["Date"].max()
+        self._latest_slice = None
+
+        # Per-country time series, split once so lookups are a dict access
+        self._by_country = {
+            country: group.sort_values("Date")
+            for country, group in data.groupby(
+                "Country/Region", sort=False, observed=True
+            )
+        }
+
+    def get_data_for_date(self, date=None):
+        """Get data for all countries on a single date (latest by default)"""
+        if date is None:
+            if self._latest_slice is None:
+                self._latest_slice = self._by_date.loc[
+                    self._latest_date : self._latest_date
+                ].reset_index(drop=True)
+            return self._latest_slice
+
+        # Normalize so partial strings ("2021-01") select one day, not a period
+        date = pd.Timestamp(date)
+        return self._by_date.loc[date:date].reset_index(drop=True)
+
     def get_top_countries_by_cases(self, n=10, latest_date=None):
         """Get top N countries by confirmed cases"""
-        if latest_date is None:
-            latest_date = self.data["Date"].max()
-
-        latest_data = self.data[self.data["Date"] == latest_date]
-        top_countries = latest_data.nlargest(n, "Confirmed")[
+        latest_data = self.get_data_for_date(latest_date)
+        top_countries = _top_n(latest_data, "Confirmed", n)[
             ["Country/Region", "Confirmed", "Deaths", "Recovered", "Death_Rate"]
         ]
 
@@ -21,13 +97,10 @@ class CovidAnalysis:
 
     def get_top_countries_by_death_rate(self, n=10, min_cases=1000, latest_date=None):
         """Get top N countries by death rate (with minimum cases filter)"""
-        if latest_date is None:
-            latest_date = self.data["Date"].max()
-
-        latest_data = self.data[self.data["Date"] == latest_date]
+        latest_data = self.get_data_for_date(latest_date)
         # Filter countries with minimum cases to avoid skewed rates
         filtered_data = latest_data[latest_data["Confirmed"] >= min_cases]
-        top_death_rates = filtered_data.nlargest(n, "Death_Rate")[
+        top_death_rates = _top_n(filtered_data, "Death_Rate", n)[
             ["Country/Region", "Confirmed", "Deaths", "Death_Rate"]
         ]
 
@@ -35,52 +108,48 @@ class CovidAnalysis:
 
     def get_country_time_series(self, country_name):
         """Get time series data for a specific country"""
-        country_data = self.data[
-            self.data["Country/Region"] == country_name
-        ].sort_values("Date")
-        return country_data
+        country_data = self._by_country.get(country_name)
+        if country_data is None:
+            return self.data.iloc[:0]
+        # Copy so callers can modify the result without touching the cache
+        return country_data.copy()
 
     def calculate_growth_rates(self, country_data):
         """Calculate daily and weekly growth rates"""
         country_data = country_data.sort_values("Date")
-
-        # Daily growth
-        country_data["Daily_Confirmed"] = country_data["Confirmed"].diff()
-        country_data["Daily_Deaths"] = country_data["Deaths"].diff()
-
-        # Growth rates
-        country_data["Confirmed_Growth_Rate"] = (
-            country_data["Confirmed"].pct_change() * 100
-        ).round(2)
-        country_data["Death_Growth_Rate"] = (
-            country_data["Deaths"].pct_change() * 100
-        ).round(2)
-
-        # 7-day moving averages
-        country_data["Confirmed_MA_7"] = (
-            country_data["Daily_Confirmed"].rolling(window=7).mean()
-        )
-        country_data["Deaths_MA_7"] = (
-            country_data["Daily_Deaths"].rolling(window=7).mean()
+        daily, growth, average = _growth_kernel(
+            country_data["Confirmed"].to_numpy(), country_data["Deaths"].to_numpy()
         )
 
-        return country_data
+        return country_data.assign(
+            # Daily growth
+            Daily_Confirmed=daily[0],
+            Daily_Deaths=daily[1],
+            # Growth rates
+            Confirmed_Growth_Rate=growth[0],
+            Death_Growth_Rate=growth[1],
+            # 7-day moving averages
+            Confirmed_MA_7=average[0],
+            Deaths_MA_7=average[1],
+        )
 
     def get_global_summary(self, date=None):
         """Get global summary statistics"""
-        if date is None:
-            date = self.data["Date"].max()
+        global_data = self.get_data_for_date(date)
 
-        global_data = self.data[self.data["Date"] == date]
+        # Reduce all metric columns in one pass over a single block
+        confirmed, deaths, recovered, active = (
+            global_data[["Confirmed", "Deaths", "Recovered", "Active"]]
+            .to_numpy(dtype=np.int64)
+            .sum(axis=0)
+        )
 
         summary = {
-            "Total_Confirmed": global_data["Confirmed"].sum(),
-            "Total_Deaths": global_data["Deaths"].sum(),
-            "Total_Recovered": global_data["Recovered"].sum(),
-            "Total_Active": global_data["Active"].sum(),
-            "Global_Death_Rate": (
-                global_data["Deaths"].sum() / global_data["Confirmed"].sum() * 100
-            ).round(2),
+            "Total_Confirmed": confirmed,
+            "Total_Deaths": deaths,
+            "Total_Recovered": recovered,
+            "Total_Active": active,
+            "Global_Death_Rate": round(deaths / confirmed * 100, 2),
             "Number_of_Countries": global_data["Country/Region"].nunique(),
         }
 
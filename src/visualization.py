@@ -20,6 +20,9 @@ class CovidVisualizer:
 
         self.colors = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b"]
 
+        # Country time series figure, reused by plot_country_time_series(reuse=True)
+        self._ts_fig, self._ts_axes, self._ts_lines = None, None, None
+
     def set_plot_style(self):
         """Set consistent plot style"""
         plt.rcParams["figure.figsize"] = [12, 8]
@@ -48,136 +51,159 @@ class CovidVisualizer:
         ax.invert_yaxis()
 
         # Add value labels on bars
-        for bar in bars:
-            width = bar.get_width()
-            label_format = (
-                f"{width:,.0f}" if metric != "Death_Rate" else f"{width:.2f}%"
-            )
-            ax.text(
-                width,
-                bar.get_y() + bar.get_height() / 2,
-                label_format,
-                ha="left",
-                va="center",
-                fontweight="bold",
-            )
+        labels = [
+            f"{value:,.0f}" if metric != "Death_Rate" else f"{value:.2f}%"
+            for value in values
+        ]
+        ax.bar_label(bars, labels=labels, fontweight="bold")
 
         plt.tight_layout()
         return fig
 
-    def plot_country_time_series(self, country_data, country_name):
-        """Plot time series for a specific country"""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
-
-        # Total cases
-        ax1.plot(
-            country_data["Date"],
-            country_data["Confirmed"],
-            label="Confirmed",
-            color=self.colors[0],
-            linewidth=2,
-        )
-        ax1.plot(
-            country_data["Date"],
-            country_data["Deaths"],
-            label="Deaths",
-            color=self.colors[3],
-            linewidth=2,
-        )
-        ax1.plot(
-            country_data["Date"],
-            country_data["Recovered"],
-            label="Recovered",
-            color=self.colors[2],
-            linewidth=2,
-        )
-        ax1.set_title(f"COVID-19 Cases in {country_name}")
-        ax1.legend()
-        ax1.tick_params(axis="x", rotation=45)
-        ax1.set_ylabel("Number of Cases")
-
-        # Daily new cases (if available)
-        if "Daily_Confirmed" in country_data.columns:
-            ax2.plot(
-                country_data["Date"],
-                country_data["Daily_Confirmed"],
-                label="Daily Confirmed",
-                alpha=0.7,
-                color=self.colors[0],
-            )
-            if "Confirmed_MA_7" in country_data.columns:
-                ax2.plot(
-                    country_data["Date"],
-                    country_data["Confirmed_MA_7"],
-                    label="7-day MA",
-                    color="red",
-                    linewidth=2,
-                )
-            ax2.set_title(f"Daily New Cases in {country_name}")
-            ax2.legend()
-            ax2.tick_params(axis="x", rotation=45)
-            ax2.set_ylabel("Daily Cases")
-
-        # Growth rates (if available)
-        if "Confirmed_Growth_Rate" in country_data.columns:
-            ax3.plot(
-                country_data["Date"],
-                country_data["Confirmed_Growth_Rate"],
-                label="Case Growth Rate",
-                color=self.colors[0],
-            )
-            if "Death_Growth_Rate" in country_data.columns:
-                ax3.plot(
-                    country_data["Date"],
-                    country_data["Death_Growth_Rate"],
-                    label="Death Growth Rate",
-                    color=self.colors[3],
-                )
-            ax3.set_title(f"Growth Rates in {country_name}")
-            ax3.legend()
-            ax3.tick_params(axis="x", rotation=45)
-            ax3.set_ylabel("Growth Rate (%)")
-
-        # Death rate over time
-        ax4.plot(
-            country_data["Date"],
-            country_data["Death_Rate"],
-            color=self.colors[3],
-            linewidth=2,
+    def _get_time_series_figure(self, reuse):
+        """Get the 2x2 country figure, reusing the last one while it is open"""
+        if reuse:
+            if self._ts_fig is not None and plt.fignum_exists(self._ts_fig.number):
+                plt.figure(self._ts_fig.number)
+                return self._ts_fig, self._ts_axes, self._ts_lines
+
+            fig, axes, lines = self._create_time_series_figure()
+            self._ts_fig, self._ts_axes, self._ts_lines = fig, axes, lines
+            return fig, axes, lines
+
+        return self._create_time_series_figure()
+
+    def _create_time_series_figure(self):
+        """Create the 2x2 country figure with one empty line per column"""
+        fig, axes = plt.subplots(2, 2, figsize=(15, 10))
+        ax1, ax2, ax3, ax4 = axes.flat
+
+        def line(ax, **kwargs):
+            return ax.plot([], [], **kwargs)[0]
+
+        # One line per column, updated in place on later calls
+        lines = {
+            # Total cases
+            "Confirmed": line(
+                ax1, label="Confirmed", color=self.colors[0], linewidth=2
+            ),
+            "Deaths": line(ax1, label="Deaths", color=self.colors[3], linewidth=2),
+            "Recovered": line(
+                ax1, label="Recovered", color=self.colors[2], linewidth=2
+            ),
+            # Daily new cases
+            "Daily_Confirmed": line(
+                ax2, label="Daily Confirmed", alpha=0.7, color=self.colors[0]
+            ),
+            "Confirmed_MA_7": line(ax2, label="7-day MA", color="red", linewidth=2),
+            # Growth rates
+            "Confirmed_Growth_Rate": line(
+                ax3, label="Case Growth Rate", color=self.colors[0]
+            ),
+            "Death_Growth_Rate": line(
+                ax3, label="Death Growth Rate", color=self.colors[3]
+            ),
+            # Death rate over time
+            "Death_Rate": line(ax4, color=self.colors[3], linewidth=2),
+        }
+
+        for ax in axes.flat:
+            ax.xaxis_date()
+            ax.tick_params(axis="x", rotation=45)
+
+        return fig, axes, lines
+
+    def plot_country_time_series(self, country_data, country_name, reuse=False):
+        """Plot time series for a specific country
+
+        With reuse=True the figure from the previous reuse=True call is
+        updated in place and returned, so earlier returned figures change.
+        """
+        fig, axes, lines = self._get_time_series_figure(reuse)
+        ax1, ax2, ax3, ax4 = axes.flat
+
+        for column, line in lines.items():
+            # Daily and growth-rate panels are only drawn if available
+            if column in country_data.columns:
+                line.set_data(country_data["Date"], country_data[column])
+                line.set_visible(True)
+            else:
+                line.set_data([], [])
+                line.set_visible(False)
+
+        has_daily = lines["Daily_Confirmed"].get_visible()
+        has_growth = lines["Confirmed_Growth_Rate"].get_visible()
+
+        panels = (
+            (ax1, True, f"COVID-19 Cases in {country_name}", "Number of Cases"),
+            (ax2, has_daily, f"Daily New Cases in {country_name}", "Daily Cases"),
+            (ax3, has_growth, f"Growth Rates in {country_name}", "Growth Rate (%)"),
+            (ax4, True, f"Death Rate Over Time in {country_name}", "Death Rate (%)"),
         )
-        ax4.set_title(f"Death Rate Over Time in {country_name}")
-        ax4.set_ylabel("Death Rate (%)")
-        ax4.tick_params(axis="x", rotation=45)
+        for ax, has_data, title, ylabel in panels:
+            ax.set_title(title if has_data else "")
+            ax.set_ylabel(ylabel if has_data else "")
+
+            # Single-line death rate panel has no legend
+            if has_data and ax is not ax4:
+                ax.legend(handles=[l for l in ax.get_lines() if l.get_visible()])
+            elif ax.get_legend() is not None:
+                ax.get_legend().remove()
+
+            if has_data:
+                ax.relim(visible_only=True)
+                ax.autoscale()
+            else:
+                ax.set_xlim(ax1.get_xlim())
+                ax.set_ylim(0, 1)
 
         plt.tight_layout()
         return fig
 
     def create_heatmap_data(self, data, countries, start_date=None, end_date=None):
         """Prepare data for heatmap visualization"""
+        if start_date is None or end_date is None:
+            latest_date = data["Date"].max()
         if start_date is None:
-            start_date = data["Date"].max() - pd.Timedelta(days=30)
+            start_date = latest_date - pd.Timedelta(days=30)
         if end_date is None:
-            end_date = data["Date"].max()
+            end_date = latest_date
 
         # Filter data for selected countries and date range
         filtered_data = data[
             (data["Country/Region"].isin(countries))
             & (data["Date"] >= start_date)
             & (data["Date"] <= end_date)
-        ].copy()
+        ]
 
         # Ensure we have data for the heatmap
         if filtered_data.empty:
             print("No data available for the selected countries and date range.")
             return None
 
-        # Pivot for heatmap
+        # Scatter values into a country x date matrix via integer codes;
+        # (Country, Date) pairs are unique, so no pivot/groupby is needed
         try:
-            heatmap_data = filtered_data.pivot_table(
-                index="Country/Region",
-                columns="Date",
-                values="Confirmed",
-                aggfunc="sum",
+            countries_index = pd.Index(countries).unique()
+            row_codes = (
+                filtered_data["Country/Region"]
+                .astype(pd.CategoricalDtype(countries_index, ordered=True))
+                .cat.codes.to_numpy()
+            )
+            col_codes, dates = pd.factorize(filtered_data["Date"], sort=True)
+            confirmed = filtered_data["Confirmed"].to_numpy()
+
+            matrix = np.zeros(
+                (len(countries_index), len(dates)), dtype=confirmed.dtype
+            )
+            matrix[row_codes, col_codes] = confirmed
+
+            # Keep only countries that actually have data in the range
+            present = np.bincount(row_codes, minlength=len(countries_index)) > 0
+            heatmap_data = pd.DataFrame(
+                matrix[present],
+                index=countries_index[present].rename("Country/Region"),
+                columns=pd.DatetimeIndex(dates, name="Date"),
             )
             return heatmap_data
         except Exception as e:
@@ -194,11 +220,13 @@ class CovidVisualizer:
 
         try:
             # Normalize data for better visualization (row-wise normalization)
-            normalized_data = heatmap_data.apply(
-                lambda x: (
-                    (x - x.min()) / (x.max() - x.min()) if x.max() > x.min() else x
-                ),
-                axis=1,
+            values = heatmap_data.to_numpy(dtype=np.float32, copy=True)
+            row_min = np.nanmin(values, axis=1, keepdims=True)
+            row_range = np.nanmax(values, axis=1, keepdims=True) - row_min
+            # Constant rows are left as-is
+            np.divide(values - row_min, row_range, out=values, where=row_range > 0)
+            normalized_data = pd.DataFrame(
+                values, index=heatmap_data.index, columns=heatmap_data.columns
             )
 
             sns.heatmap(
@@ -222,7 +250,7 @@ class CovidVisualizer:
         if date is None:
             date = data["Date"].max()
 
-        map_data = data[data["Date"] == date].copy()
+        map_data = data[data["Date"] == date]
 
         # Remove rows with missing coordinates
         map_data = map_data.dropna(subset=["Lat", "Long"])
@@ -261,9 +289,15 @@ class CovidVisualizer:
         """Plot comparison of multiple countries"""
         fig, ax = plt.subplots(figsize=(14, 8))
 
+        # Filter all requested countries in one scan, then split by country
+        subset = data[data["Country/Region"].isin(countries)].sort_values("Date")
+        by_country = dict(
+            iter(subset.groupby("Country/Region", sort=False, observed=True))
+        )
+
         for i, country in enumerate(countries):
-            country_data = data[data["Country/Region"] == country].sort_values("Date")
-            if not country_data.empty:
+            country_data = by_country.get(country)
+            if country_data is not None:
                 ax.plot(
                     country_data["Date"],
                     country_data[metric],